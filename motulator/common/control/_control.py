@@ -5,7 +5,7 @@ from types import SimpleNamespace
 
 import numpy as np
 
-from motulator.common.utils import abc2complex, complex2abc
+from motulator.common.utils import abc2complex, cis, complex2abc
 
 
 # %%
@@ -98,7 +98,7 @@ class PWM:
                 theta0 = np.pi/3 - alpha_g
 
             # Modified reference voltage
-            ref_u_cs = r*np.exp(1j*(theta0 + sector*np.pi/3))
+            ref_u_cs = r*cis(theta0 + sector*np.pi/3)
 
         return ref_u_cs
 
@@ -165,7 +165,7 @@ class PWM:
         # Advance the angle due to the computational delay (N*T_s) and the ZOH
         # (PWM) delay (0.5*T_s), typically 1.5*T_s*w
         theta_comp = self.k_comp*T_s*w
-        ref_u_cs = np.exp(1j*theta_comp)*ref_u_cs
+        ref_u_cs = cis(theta_comp)*ref_u_cs
 
         # Modify angle in the overmodulation region
         if self.overmodulation == "six_step":
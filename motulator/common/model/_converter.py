@@ -7,6 +7,7 @@ Complex space vectors are used also for duty ratios and switching states,
 wherever applicable.
 
 """
+import math
 from types import SimpleNamespace
 
 import numpy as np
@@ -14,6 +15,16 @@ import numpy as np
 from motulator.common.model import Subsystem
 from motulator.common.utils import abc2complex, complex2abc
 
+# Constants of the six-pulse diode-bridge voltage computation
+_SEGMENT = math.pi/3  # Width of one 60-degree segment (rad)
+_SQRT3 = math.sqrt(3)
+
+
+# %%
+def _no_external_current(t):
+    """Picklable default for the external DC current."""
+    return None
+
 
 # %%
 class VoltageSourceConverter(Subsystem):
@@ -32,7 +43,7 @@ class VoltageSourceConverter(Subsystem):
 
     """
 
-    def __init__(self, u_dc, C_dc=None, i_dc=lambda t: None):
+    def __init__(self, u_dc, C_dc=None, i_dc=_no_external_current):
         super().__init__()
         self.par = SimpleNamespace(u_dc=u_dc, C_dc=C_dc)
         self.inp = SimpleNamespace(q_cs=None, i_cs=0j)
@@ -58,7 +69,10 @@ class VoltageSourceConverter(Subsystem):
     @property
     def i_dc_int(self):
         """Converter-side DC current (A)."""
-        return 1.5*np.real(self.inp.q_cs*np.conj(self.inp.i_cs))
+        # Scalar form of 1.5*real(q_cs*conj(i_cs)), evaluated at every solver
+        # call when the DC-bus dynamics are modeled
+        q_cs, i_cs = self.inp.q_cs, self.inp.i_cs
+        return 1.5*(q_cs.real*i_cs.real + q_cs.imag*i_cs.imag)
 
     def set_outputs(self, _):
         """Set output variables."""
@@ -99,6 +113,34 @@ class VoltageSourceConverter(Subsystem):
         data.i_dc_int = 1.5*np.real(data.q_cs*np.conj(data.i_cs))
 
 
+# %%
+def _frequency_converter_rhs(u_g, w_g, L_dc, exp_j_theta_g, i_L, u_dc):
+    """
+    Compute the diode-bridge state derivatives.
+
+    This pure-scalar kernel contains the arithmetic of the rhs method of
+    `FrequencyConverter`. As a module-level function of primitive arguments,
+    the solver-rate evaluation runs on local variables, and the kernel shape
+    is directly compilable.
+
+    """
+    # Grid voltage
+    u_gs = u_g*exp_j_theta_g
+    # Output voltage of the diode bridge. For a balanced three-phase set,
+    # amax(u_g_abc) - amin(u_g_abc) equals sqrt(3)*abs(u_gs)*cos(phi),
+    # where phi is the voltage angle folded onto one 60-degree segment of
+    # the six-pulse waveform.
+    phi = math.atan2(u_gs.imag, u_gs.real) % _SEGMENT
+    u_di = _SQRT3*abs(u_gs)*math.cos(phi - .5*_SEGMENT)
+    # State derivatives
+    d_exp_j_theta_g = 1j*w_g*exp_j_theta_g
+    d_i_L = (u_di - u_dc)/L_dc
+    # The inductor current cannot be negative due to the diode bridge
+    if i_L < 0 and d_i_L < 0:
+        d_i_L = 0
+    return d_i_L, d_exp_j_theta_g
+
+
 # %%
 class FrequencyConverter(VoltageSourceConverter):
     """
@@ -141,17 +183,9 @@ class FrequencyConverter(VoltageSourceConverter):
 
     def rhs(self):
         """Compute the state derivatives."""
-        # Grid voltage
-        u_gs = self.par.u_g*self.state.exp_j_theta_g
-        u_g_abc = complex2abc(u_gs)
-        # Output voltage of the diode bridge
-        u_di = np.amax(u_g_abc, axis=0) - np.amin(u_g_abc, axis=0)
-        # State derivatives
-        d_exp_j_theta_g = 1j*self.par.w_g*self.state.exp_j_theta_g
-        d_i_L = (u_di - self.inp.u_dc)/self.par.L_dc
-        # The inductor current cannot be negative due to the diode bridge
-        if self.state.i_L < 0 and d_i_L < 0:
-            d_i_L = 0
+        d_i_L, d_exp_j_theta_g = _frequency_converter_rhs(
+            self.par.u_g, self.par.w_g, self.par.L_dc,
+            self.state.exp_j_theta_g, self.state.i_L, self.inp.u_dc)
         return super().rhs() + [d_i_L, d_exp_j_theta_g]
 
     def post_process_states(self):
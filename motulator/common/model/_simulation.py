@@ -1,6 +1,8 @@
 """Simulation environment."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from types import SimpleNamespace
 
 import numpy as np
@@ -261,7 +263,7 @@ class Simulation:
                     self.mdl.t0 = t_span[-1]
 
                     # Save the solution
-                    sol.q_cs = len(sol.t)*[q_cs[i]]
+                    sol.q_cs = np.full(len(sol.t), q_cs[i])
                     self.mdl.save(sol)
 
     def save_mat(self, name="sim"):
@@ -278,6 +280,54 @@ class Simulation:
         savemat(name + "_ctrl_data" + ".mat", self.ctrl.data)
 
 
+# %%
+def _simulate_one(build, t_stop, max_step, cfg):
+    """Build and run one simulation in a worker process."""
+    sim = build(cfg)
+    sim.simulate(t_stop, max_step)
+    return sim
+
+
+def simulate_batch(build, configs, t_stop=1, max_step=np.inf,
+                   max_workers=None):
+    """
+    Run independent simulations in parallel processes.
+
+    Each simulation is independent of the others, so a parameter sweep can
+    use all available processor cores. The simulations are built and run in
+    worker processes and the completed Simulation objects are returned in
+    the order of `configs`.
+
+    Parameters
+    ----------
+    build : callable
+        Function that takes one element of `configs` and returns a new
+        Simulation object. It must be defined at the module level and its
+        argument and the returned simulation must be picklable, e.g.,
+        callable references such as `Sequence` and `Step` objects can be
+        used but locally defined lambdas cannot.
+    configs : iterable
+        Configurations, one per simulation.
+    t_stop : float, optional
+        Simulation stop time. The default is 1.
+    max_step : float, optional
+        Max step size of the solver. The default is inf.
+    max_workers : int, optional
+        Maximum number of worker processes. The default is the number of
+        processors.
+
+    Returns
+    -------
+    list of Simulation
+        Simulated objects, containing the post-processed data.
+
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(partial(_simulate_one, build, t_stop, max_step),
+                         configs))
+
+
 # %%
 class Model(ABC):
     """
@@ -366,25 +416,28 @@ class Model(ABC):
 
     def save(self, sol):
         """Save the solution."""
-        self.sol_t.extend(sol.t)
-        self.converter.sol_q_cs.extend(sol.q_cs)
+        # The solution arrays are stored as chunks and concatenated once in
+        # post-processing, avoiding boxing every sample into a Python object
+        self.sol_t.append(sol.t)
+        self.converter.sol_q_cs.append(sol.q_cs)
 
         index = 0
         for subsystem in self.subsystems:
             if hasattr(subsystem, "sol_states"):
                 for attr in vars(subsystem.sol_states):
-                    subsystem.sol_states.__dict__[attr].extend(sol.y[index])
+                    subsystem.sol_states.__dict__[attr].append(sol.y[index])
                     index += 1
 
     def post_process_states(self):
-        """Transform the lists to the ndarray format and post-process them."""
-        self.converter.data.q_cs = np.asarray(self.converter.sol_q_cs)
+        """Concatenate the solution chunks and post-process them."""
+        self.converter.data.q_cs = np.concatenate(self.converter.sol_q_cs)
+        t = np.concatenate(self.sol_t)
 
         for subsystem in self.subsystems:
-            subsystem.data.t = np.asarray(self.sol_t)
+            subsystem.data.t = t
             if hasattr(subsystem, "sol_states"):
                 for key, value in vars(subsystem.sol_states).items():
-                    setattr(subsystem.data, key, np.asarray(value))
+                    setattr(subsystem.data, key, np.concatenate(value))
 
             if hasattr(subsystem, "post_process_states"):
                 subsystem.post_process_states()
@@ -1,9 +1,10 @@
 """Common utilities."""
 from motulator.common.utils._utils import (
-    abc2complex, complex2abc, Sequence, Step, wrap)
+    abc2complex, cis, complex2abc, Sequence, Step, wrap)
 
 __all__ = [
     "abc2complex",
+    "cis",
     "complex2abc",
     "Sequence",
     "Step",
@@ -1,10 +1,14 @@
 """Helper functions and classes."""
 
 # %%
+import cmath
+import math
 from dataclasses import dataclass
 
 import numpy as np
 
+_TWO_PI = 2*math.pi
+
 
 # %%
 def abc2complex(u):
@@ -81,12 +85,13 @@ class Sequence:
     """
 
     def __init__(self, times, values, periodic=False):
-        self.times = times
-        self.values = values
+        self.times = np.ascontiguousarray(times, dtype=float)
+        self.values = np.ascontiguousarray(values)
         if periodic is True:
-            self._period = times[-1] - times[0]
+            self._period = self.times[-1] - self.times[0]
         else:
             self._period = None
+        self._last_i = 0  # Segment cache for the scalar fast path
 
     def __call__(self, t):
         """
@@ -94,7 +99,7 @@ class Sequence:
 
         Parameters
         ----------
-        t : float
+        t : float or ndarray
             Time.
 
         Returns
@@ -103,7 +108,27 @@ class Sequence:
             Interpolated output.
 
         """
-        return np.interp(t, self.times, self.values, period=self._period)
+        if np.ndim(t) > 0 or self._period is not None:
+            # Periodic sequences also take this branch, since np.interp
+            # folds the breakpoints onto the period in a way that the
+            # segment lookup below does not reproduce, e.g. for duplicate
+            # breakpoints on the period boundary.
+            return np.interp(t, self.times, self.values, period=self._period)
+        # Scalar fast path, called at every solver evaluation
+        times, values = self.times, self.values
+        if t <= times[0]:
+            return values[0]
+        if t >= times[-1]:
+            return values[-1]
+        # The time is nondecreasing during a simulation, so the cached
+        # segment index typically still holds and the binary search is
+        # skipped.
+        i = self._last_i
+        if not times[i] <= t < times[i + 1]:
+            i = np.searchsorted(times, t, side="right") - 1
+            self._last_i = i
+        d_t = times[i + 1] - times[i]
+        return values[i] + (values[i + 1] - values[i])*(t - times[i])/d_t
 
 
 # %%
@@ -133,6 +158,29 @@ class Step:
         return self.initial_value + (t >= self.step_time)*self.step_value
 
 
+# %%
+def cis(theta):
+    """
+    Compute the unit complex rotation exp(1j*theta).
+
+    This is a scalar fast path for ``np.exp(1j*theta)``: it computes the
+    cosine and sine directly instead of dispatching the general complex
+    exponential. The inverse rotation is obtained with ``cis(-theta)``.
+
+    Parameters
+    ----------
+    theta : float
+        Angle (rad).
+
+    Returns
+    -------
+    complex
+        Unit complex number exp(1j*theta).
+
+    """
+    return cmath.rect(1., theta)
+
+
 # %%
 def wrap(theta):
     """
@@ -140,21 +188,29 @@ def wrap(theta):
 
     Parameters
     ----------
-    theta : float
+    theta : float or ndarray
         Angle (rad).
 
     Returns
     -------
-    float
+    float or ndarray
         Limited angle.
 
     """
+    if isinstance(theta, float):
+        # Scalar fast path, called at every sampling period. This produces
+        # the same values as the array branch below, since fmod is exact and
+        # np.mod adjusts the fmod result by the same addition.
+        theta = math.fmod(theta + math.pi, _TWO_PI)
+        if theta < 0:
+            theta += _TWO_PI
+        return theta - math.pi
 
     return np.mod(theta + np.pi, 2*np.pi) - np.pi
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class NominalValues:
     """
     Nominal values.
@@ -182,7 +238,7 @@ class NominalValues:
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class BaseValues:
     # pylint: disable=too-many-instance-attributes
     """
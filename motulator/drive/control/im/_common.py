@@ -1,5 +1,7 @@
 """Common control functions and classes for for induction machine drives."""
 
+import math
+from functools import partial
 from types import SimpleNamespace
 from dataclasses import dataclass, field, InitVar
 
@@ -9,6 +11,17 @@ from motulator.drive.utils import InductionMachineInvGammaPars
 from motulator.common.utils import wrap
 
 
+# %%
+def _default_k_o_sensorless(alpha, w_m):
+    """Default observer gain in the sensorless mode."""
+    return (.5*alpha + .2*abs(w_m))/(alpha - 1j*w_m)
+
+
+def _default_k_o_sensored(alpha, w_m):
+    """Default observer gain in the sensored mode."""
+    return 1 + .2*abs(w_m)/(alpha - 1j*w_m)
+
+
 # %%
 @dataclass
 class ObserverCfg:
@@ -46,16 +59,82 @@ class ObserverCfg:
 
     def __post_init__(self, alpha_o, k_o):
         alpha = self.par.R_R/self.par.L_M
-        if self.sensorless:
-            k_o = (
-                lambda w_m: (.5*alpha + .2*np.abs(w_m))/
-                (alpha - 1j*w_m)) if k_o is None else k_o
-        else:
-            k_o = (
-                lambda w_m: 1 + .2*np.abs(w_m)/
-                (alpha - 1j*w_m)) if k_o is None else k_o
-        # Collect the gains
-        self.gain = SimpleNamespace(alpha_o=alpha_o, k_o=k_o)
+        if k_o is None:
+            # Bind the precomputed alpha to the module-level default gain
+            # function instead of building a new closure per instance
+            k_o = partial(
+                _default_k_o_sensorless
+                if self.sensorless else _default_k_o_sensored, alpha)
+        # Collect the gains, including the constant coefficients that would
+        # otherwise be recomputed at every sampling period
+        self.gain = SimpleNamespace(alpha=alpha, alpha_o=alpha_o, k_o=k_o)
+
+
+# %%
+class _FullOrderObserverEstimates:
+    """Slotted container for the full-order observer state estimates."""
+
+    __slots__ = ("psi_R", "i_s", "theta_s", "w_m")
+
+    def __init__(self):
+        self.psi_R, self.i_s, self.theta_s, self.w_m = 0, 0, 0, 0
+
+
+class _FullOrderObserverWork:
+    """Slotted container for the full-order observer work variables."""
+
+    __slots__ = ("d_psi_R", "d_i_s", "d_w_m")
+
+    def __init__(self):
+        self.d_psi_R, self.d_i_s, self.d_w_m = 0, 0, 0
+
+
+# %%
+def _observer_step(
+        R_s, R_R, L_sgm, alpha, alpha_o, theta_s, psi_R, w_m, u_ss, i_ss,
+        old_i_s, T_s, k_o1, k_o2):
+    """
+    Compute one step of the reduced-order observer.
+
+    This pure-scalar kernel contains the arithmetic of `Observer.output`. It
+    is a module-level function of primitive arguments, so the hot loop runs on
+    local variables instead of repeated attribute lookups. The machine
+    parameters and constant gains come first so that they can be bound once
+    per configuration with `functools.partial`. Both sensorless and sensored
+    modes are covered by the gains `k_o1` and `k_o2`, which are evaluated by
+    the caller.
+
+    """
+    # Current and voltage vectors in estimated rotor flux coordinates
+    rot = complex(math.cos(theta_s), -math.sin(theta_s))
+    i_s = rot*i_ss
+    u_s = rot*u_ss
+
+    # Stator flux estimate
+    psi_s = L_sgm*i_s + psi_R
+
+    # Induced voltage from the stator quantities (without the w_s term that
+    # is taken into account separately to avoid an algebraic loop)
+    d_i_s = (i_s - old_i_s)/T_s
+    v_s = u_s - R_s*i_s - L_sgm*d_i_s
+
+    # Induced voltage from the rotor quantities
+    v_r = R_R*i_s - (alpha - 1j*w_m)*psi_R
+
+    # Angular frequencies
+    den = psi_R + L_sgm*((1 - k_o1)*i_s + k_o2*i_s.conjugate()).real
+    dv = v_r - v_s
+    num = (v_s + k_o1*dv + k_o2*dv.conjugate()).imag
+    w_s = num/den if den > 0 else w_m
+    w_r = R_R*i_s.imag/psi_R if psi_R > 0 else 0
+
+    # Derivatives for the update method
+    v = v_s - 1j*w_s*L_sgm*i_s
+    dv = v_r - v
+    d_psi_R = (v + k_o1*dv + k_o2*dv.conjugate()).real
+    d_w_m = alpha_o*(w_s - w_r - w_m)
+
+    return i_s, u_s, psi_s, w_s, w_r, d_psi_R, d_w_m
 
 
 # %%
@@ -85,10 +164,18 @@ class Observer:
     def __init__(self, cfg):
         self.par, self.gain, self.T_s = cfg.par, cfg.gain, cfg.T_s
         self.sensorless = cfg.sensorless
-        # Initialize the state estimates
-        self.est = SimpleNamespace(psi_R=0, theta_s=0, w_m=0)
-        # Private work variables for the update method
-        self._work = SimpleNamespace(d_psi_R=0, d_w_m=0, old_i_s=0)
+        # Specialize the observer step for this configuration by binding the
+        # constant machine parameters and gains to the kernel once
+        self._step = partial(
+            _observer_step, cfg.par.R_s, cfg.par.R_R, cfg.par.L_sgm,
+            cfg.gain.alpha, cfg.gain.alpha_o)
+        # State estimates and their derivatives, packed as numeric arrays
+        # [psi_R, theta_s, w_m] so that the update is a single vector
+        # operation
+        self._est = np.zeros(3)
+        self._deriv = np.zeros(3)
+        # Private work variable for the update method
+        self._old_i_s = 0
 
     def output(self, fbk):
         """
@@ -131,63 +218,42 @@ class Observer:
                     Stator flux estimate (Vs).
 
         """
-        # Unpack
-        par, gain = self.par, self.gain
-
         # Get the rotor flux estimate
-        fbk.psi_R, fbk.theta_s = self.est.psi_R, self.est.theta_s
+        fbk.psi_R, fbk.theta_s = self._est[0], self._est[1]
 
         # Get the rotor speed estimate in the sensorless mode
-        fbk.w_m = self.est.w_m if self.sensorless else fbk.w_m
-
-        # Current and voltage vectors in estimated rotor flux coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
-
-        # Stator flux estimate
-        fbk.psi_s = par.L_sgm*fbk.i_s + fbk.psi_R
-
-        # Induced voltage from the stator quantities (without the w_s term that
-        # is taken into account separately to avoid an algebraic loop)
-        d_i_s = (fbk.i_s - self._work.old_i_s)/self.T_s
-        v_s = fbk.u_s - par.R_s*fbk.i_s - par.L_sgm*d_i_s
-
-        # Induced voltage from the rotor quantities
-        v_r = par.R_R*fbk.i_s - (par.R_R/par.L_M - 1j*fbk.w_m)*fbk.psi_R
+        fbk.w_m = self._est[2] if self.sensorless else fbk.w_m
 
         # Observer gains
         if self.sensorless:
-            k_o1 = gain.k_o(fbk.w_m)
+            k_o1 = self.gain.k_o(fbk.w_m)
             k_o2 = k_o1
         else:
-            k_o1, k_o2 = gain.k_o(fbk.w_m), 0
+            k_o1, k_o2 = self.gain.k_o(fbk.w_m), 0
 
-        # Angular frequencies
-        den = fbk.psi_R + par.L_sgm*np.real(
-            (1 - k_o1)*fbk.i_s + k_o2*np.conj(fbk.i_s))
-        num = np.imag(v_s + k_o1*(v_r - v_s) + k_o2*np.conj(v_r - v_s))
-        fbk.w_s = num/den if den > 0 else fbk.w_m
-        fbk.w_r = par.R_R*fbk.i_s.imag/fbk.psi_R if fbk.psi_R > 0 else 0
+        # Run the arithmetic in the kernel specialized for this configuration
+        (fbk.i_s, fbk.u_s, fbk.psi_s, fbk.w_s, fbk.w_r, d_psi_R,
+         d_w_m) = self._step(
+             fbk.theta_s, fbk.psi_R, fbk.w_m, fbk.u_ss, fbk.i_ss,
+             self._old_i_s, self.T_s, k_o1, k_o2)
 
-        # Compute and store the derivatives for the update method
-        v = v_s - 1j*fbk.w_s*par.L_sgm*fbk.i_s
-        self._work.d_psi_R = np.real(
-            v + k_o1*(v_r - v) + k_o2*np.conj(v_r - v))
-        self._work.d_w_m = gain.alpha_o*(fbk.w_s - fbk.w_r - fbk.w_m)
+        # Store the derivatives for the update method. The angle derivative
+        # is w_s, so that the update is est += T_s*deriv.
+        self._deriv[0], self._deriv[1], self._deriv[2] = (
+            d_psi_R, fbk.w_s, d_w_m)
 
         return fbk
 
     def update(self, T_s, fbk):
         """Update the state estimates."""
-        self.est.psi_R += T_s*self._work.d_psi_R
-        self.est.theta_s = wrap(fbk.theta_s + T_s*fbk.w_s)
-        self.est.w_m += T_s*self._work.d_w_m
+        self._est += T_s*self._deriv
+        self._est[1] = wrap(self._est[1])
 
         # Update the sampling period (needed in the output method)
         self.T_s = T_s
 
         # Store the old current
-        self._work.old_i_s = fbk.i_s
+        self._old_i_s = fbk.i_s
 
 
 # %%
@@ -206,9 +272,9 @@ class FullOrderObserverCfg(ObserverCfg):
 
     def __post_init__(self, alpha_o, k_o, alpha_i):
         super().__post_init__(alpha_o, k_o)
-        alpha = self.par.R_R/self.par.L_M
         self.gain.alpha_i = alpha_i if alpha_i is not None else self.alpha_i
-        self.gain.g = alpha_i - alpha
+        self.gain.g = alpha_i - self.gain.alpha
+        self.gain.R_sgm = self.par.R_s + self.par.R_R
 
 
 # %%
@@ -238,9 +304,9 @@ class FullOrderObserver:
         self.par, self.gain = cfg.par, cfg.gain
         self.sensorless = cfg.sensorless
         # Initialize the state estimates
-        self.est = SimpleNamespace(psi_R=0, i_s=0, theta_s=0, w_m=0)
+        self.est = _FullOrderObserverEstimates()
         # Private work variables for the update method
-        self._work = SimpleNamespace(d_psi_R=0, d_i_s=0, d_w_m=0)
+        self._work = _FullOrderObserverWork()
 
         if not self.sensorless:
             raise NotImplementedError(
@@ -250,16 +316,16 @@ class FullOrderObserver:
         """Output."""
 
         # Unpack
-        par, gain = self.par, self.gain,
-        par.R_sgm, par.alpha = par.R_s + par.R_R, par.R_R/par.L_M
+        par, gain = self.par, self.gain
 
         # Get the estimates
         fbk.psi_R, fbk.theta_s = self.est.psi_R, self.est.theta_s
         fbk.w_m = self.est.w_m
 
         # Current and voltage vectors in estimated rotor flux coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        rot = complex(math.cos(fbk.theta_s), -math.sin(fbk.theta_s))
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Stator flux estimate
         fbk.psi_s = par.L_sgm*self.est.i_s + fbk.psi_R
@@ -273,20 +339,23 @@ class FullOrderObserver:
             fbk.psi_R) if fbk.psi_R > 0 else 0
         w_m = p_term + self.est.w_m
 
+        # Observer gain, evaluated once per step
+        k_o = gain.k_o(w_m)
+
         # Angular frequency of the rotor flux vector
         den = fbk.psi_R - par.L_sgm*err_i_s.real
         num = par.R_R*fbk.i_s.imag + par.L_sgm*(
-            gain.alpha_i*gain.k_o(w_m).imag*err_i_s.real - gain.g*err_i_s.imag)
+            gain.alpha_i*k_o.imag*err_i_s.real - gain.g*err_i_s.imag)
         fbk.w_s = w_m + num/den if den > 0 else w_m
 
         # Compute the derivatives
-        k_i = par.L_sgm*(gain.g - 1j*(fbk.w_s - w_m)) - par.R_sgm
+        k_i = par.L_sgm*(gain.g - 1j*(fbk.w_s - w_m)) - gain.R_sgm
         self._work.d_i_s = (
-            fbk.u_s - (par.R_sgm + 1j*fbk.w_s*par.L_sgm)*self.est.i_s +
-            (par.alpha - 1j*w_m)*fbk.psi_R + k_i*err_i_s)/par.L_sgm
+            fbk.u_s - (gain.R_sgm + 1j*fbk.w_s*par.L_sgm)*self.est.i_s +
+            (gain.alpha - 1j*w_m)*fbk.psi_R + k_i*err_i_s)/par.L_sgm
         self._work.d_psi_R = (
-            -par.alpha*fbk.psi_R + par.R_R*fbk.i_s.real +
-            (gain.alpha_i*gain.k_o(w_m).real - gain.g)*par.L_sgm*err_i_s.real -
+            -gain.alpha*fbk.psi_R + par.R_R*fbk.i_s.real +
+            (gain.alpha_i*k_o.real - gain.g)*par.L_sgm*err_i_s.real -
             (fbk.w_s - w_m)*par.L_sgm*err_i_s.imag)
 
         # Derivative of the integral term of the speed estimate
@@ -12,6 +12,7 @@ from motulator.drive.control import DriveControlSystem, SpeedController
 from motulator.common.control import ComplexPIController
 from motulator.drive.control.im._common import Observer, ObserverCfg
 from motulator.drive.utils import InductionMachineInvGammaPars
+from motulator.common.utils import cis
 
 
 # %%
@@ -64,7 +65,7 @@ class CurrentVectorControl(DriveControlSystem):
         ref = super().get_torque_reference(fbk, ref)
         ref = self.current_reference.output(fbk, ref)
         ref.u_s = self.current_ctrl.output(ref.i_s, fbk.i_s)
-        u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+        u_ss = ref.u_s*cis(fbk.theta_s)
         ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
 
         return ref
@@ -6,6 +6,7 @@ import numpy as np
 
 from motulator.drive.control import DriveControlSystem, SpeedController
 from motulator.drive.control.im._common import Observer, ObserverCfg
+from motulator.common.utils import cis
 
 
 @dataclass
@@ -125,7 +126,7 @@ class FluxVectorControl(DriveControlSystem):
 
         # Stator voltage reference
         ref.u_s = par.R_s*fbk.i_s + 1j*(fbk.w_m + fbk.w_r)*fbk.psi_s + e_sp
-        u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+        u_ss = ref.u_s*cis(fbk.theta_s)
         ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
 
         return ref
@@ -1,5 +1,6 @@
 """Observer-based V/Hz control for induction machine drives."""
 
+from functools import partial
 from types import SimpleNamespace
 from dataclasses import dataclass
 
@@ -7,7 +8,7 @@ import numpy as np
 
 from motulator.drive.control import DriveControlSystem
 from motulator.common.control import RateLimiter
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
 
 
 # %%
@@ -97,7 +98,7 @@ class ObserverBasedVHzControl(DriveControlSystem):
             ref.u_s = (
                 par.R_s*ref.i_s + 1j*fbk.w_s*ref.psi_s +
                 par.L_sgm*cfg.alpha_psi*(ref.i_s - fbk.i_s))
-            u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+            u_ss = ref.u_s*cis(fbk.theta_s)
             ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
             return ref
 
@@ -109,8 +110,9 @@ class ObserverBasedVHzControl(DriveControlSystem):
 
         # Coordinate transformations
         fbk.theta_s = self.theta_s
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        rot = cis(-fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Torque and slip estimates
         fbk.tau_M = 1.5*par.n_p*np.imag(fbk.i_s*np.conj(fbk.psi_R))
@@ -136,6 +138,12 @@ class ObserverBasedVHzControl(DriveControlSystem):
         self.theta_s = wrap(fbk.theta_s + ref.T_s*fbk.w_s)
 
 
+# %%
+def _default_b(alpha, zeta_inf, w_m):
+    """Default coefficient of the observer characteristic polynomial."""
+    return alpha + 2*zeta_inf*abs(w_m)
+
+
 # %%
 class FluxObserver:
     """
@@ -172,7 +180,7 @@ class FluxObserver:
         self.alpha_o = alpha_o
         zeta_inf = .2  # Damping ratio at high speeds
         alpha = par.R_R/par.L_M
-        self.b = lambda w_m: alpha + 2*zeta_inf*np.abs(w_m) if b is None else b
+        self.b = partial(_default_b, alpha, zeta_inf) if b is None else b
         # Initialize states
         self.est = SimpleNamespace(psi_R=0, w_m=0)
         # Private work variable
@@ -187,17 +195,17 @@ class FluxObserver:
         """Update the states."""
         # Unpack
         par = self.par
-        par.alpha = par.R_R/par.L_M
+        alpha = par.R_R/par.L_M
 
         # Observer gain with c = w_s**2 (without the orthogonal projection
         # which is embedded into the error signal and the state update)
-        g = self.b(fbk.w_m)/(par.alpha - 1j*fbk.w_m)
+        g = self.b(fbk.w_m)/(alpha - 1j*fbk.w_m)
 
         # Time derivative of the stator current
         d_i_s = (fbk.i_s - self._old_i_s)/T_s
 
         # Induced voltage from the rotor quantities
-        e_r = par.R_R*fbk.i_s - (par.alpha - 1j*fbk.w_m)*fbk.psi_R
+        e_r = par.R_R*fbk.i_s - (alpha - 1j*fbk.w_m)*fbk.psi_R
 
         # Induced voltage from stator quantities
         e_s = fbk.u_s - par.R_s*fbk.i_s - par.L_sgm*(
@@ -9,7 +9,7 @@ import numpy as np
 from motulator.drive.control import DriveControlSystem
 from motulator.drive.utils import InductionMachineInvGammaPars
 from motulator.common.control import PWM, RateLimiter
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
 
 
 # %%
@@ -69,8 +69,9 @@ class VHzControl(DriveControlSystem):
         """Get the feedback signals."""
         fbk = super().get_feedback_signals(mdl)
         fbk.theta_s = self.theta_s
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        rot = cis(-fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
         return fbk
 
     def _compute_stator_frequency(self, fbk, ref):
@@ -89,17 +90,17 @@ class VHzControl(DriveControlSystem):
     # Define the voltage reference computation
     def _compute_voltage_reference(self, fbk, ref):
         par = self.par
-        par.alpha = par.R_R/par.L_M
+        alpha = par.R_R/par.L_M
         # Nominal magnetizing current
         nom_i_sd = ref.psi_s/(par.L_M + par.L_sgm)
         # Operating-point current for RI compensation
         ref_i_s0 = nom_i_sd + 1j*ref.i_s.imag
         # Term -R_s omitted to avoid problems due to the voltage saturation
         # k = -R_s + k_u*L_sgm*(alpha + 1j*w_m0)
-        k = self.gain.k_u*par.L_sgm*(par.alpha + 1j*fbk.w_s)
+        k = self.gain.k_u*par.L_sgm*(alpha + 1j*fbk.w_s)
         ref.u_s = (
             par.R_s*ref_i_s0 + 1j*fbk.w_s*ref.psi_s + k*(ref.i_s - fbk.i_s))
-        ref.u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+        ref.u_ss = ref.u_s*cis(fbk.theta_s)
         ref.d_abc = self.pwm(ref.T_s, ref.u_ss, fbk.u_dc, fbk.w_s)
         return ref
 
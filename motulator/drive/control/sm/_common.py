@@ -1,12 +1,29 @@
 """Common control functions and classes for for synchronous machine drives."""
 
+from functools import partial
 from types import SimpleNamespace
 from dataclasses import dataclass, field, InitVar
 
 import numpy as np
 
 from motulator.drive.utils import SynchronousMachinePars
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
+
+
+# %%
+def _default_k_o_sensorless(sigma0, w_m):
+    """Default observer gain in the sensorless mode."""
+    return sigma0 + .2*abs(w_m)
+
+
+def _default_k_o_sensored(_):
+    """Default observer gain in the sensored mode."""
+    return 2*np.pi*15
+
+
+def _zero_gain(_):
+    """Default PM-flux estimation gain."""
+    return 0
 
 
 # %%
@@ -44,15 +61,18 @@ class ObserverCfg:
 
     def __post_init__(self, alpha_o, k_o, k_f):
 
-        # Observer gain
-        if self.sensorless:
-            par = self.par
-            sigma0 = .25*par.R_s*(par.L_d + par.L_q)/(par.L_d*par.L_q)
-            k_o = (lambda w_m: sigma0 + .2*np.abs(w_m)) if k_o is None else k_o
-        else:
-            k_o = (lambda w_m: 2*np.pi*15) if k_o is None else k_o
+        # Observer gain. The constant part is precomputed and bound to the
+        # module-level default gain function instead of building a new
+        # closure per instance.
+        if k_o is None:
+            if self.sensorless:
+                par = self.par
+                sigma0 = .25*par.R_s*(par.L_d + par.L_q)/(par.L_d*par.L_q)
+                k_o = partial(_default_k_o_sensorless, sigma0)
+            else:
+                k_o = _default_k_o_sensored
         # PM-flux estimation gain
-        k_f = (lambda w_m: 0) if k_f is None else k_f
+        k_f = _zero_gain if k_f is None else k_f
         # Collect the gains
         self.gain = SimpleNamespace(alpha_o=alpha_o, k_o=k_o, k_f=k_f)
 
@@ -149,8 +169,9 @@ class Observer:
             fbk.theta_m, fbk.w_m = self.est.theta_m, self.est.w_m
 
         # Current and voltage vectors in (estimated) rotor coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_m)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_m)*fbk.u_ss
+        rot = cis(-fbk.theta_m)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Current estimation error, scaled by the stator inductances
         e = (
@@ -158,21 +179,22 @@ class Observer:
             fbk.psi_s)
 
         # Auxiliary flux
-        psi_a = fbk.psi_f + (par.L_d - par.L_q)*np.conj(fbk.i_s)
+        psi_a = fbk.psi_f + (par.L_d - par.L_q)*fbk.i_s.conjugate()
 
         # Observer gains and error terms
         if self.sensorless:
             # Observer gains
             k_o1 = gain.k_o(fbk.w_m)
-            k_o2 = k_o1*psi_a/np.conj(psi_a) if np.abs(psi_a) > 0 else k_o1
-
-            # Error term for the rotor angle and speed estimation
-            eps_m = -np.imag(e/psi_a) if np.abs(psi_a) > 0 else 0
+            if abs(psi_a) > 0:
+                k_o2 = k_o1*psi_a/psi_a.conjugate()
+                # Error terms for the rotor angle, speed, and PM-flux
+                # estimation
+                e_a = e/psi_a
+                eps_m, eps_f = -e_a.imag, -e_a.real
+            else:
+                k_o2, eps_m, eps_f = k_o1, 0, 0
             # Angular speed of the coordinate system
             fbk.w_s = 2*gain.alpha_o*eps_m + fbk.w_m
-
-            # Error term for the PM-flux estimation
-            eps_f = -np.real(e/psi_a) if np.abs(psi_a) > 0 else 0
         else:
             # Sensored mode assumes that the control system operates in the
             # measured rotor coordinates
@@ -183,7 +205,7 @@ class Observer:
         # Compute and store the time derivatives for the update method
         self._work.d_psi_s = (
             fbk.u_s - par.R_s*fbk.i_s - 1j*fbk.w_s*fbk.psi_s + k_o1*e +
-            k_o2*np.conj(e))
+            k_o2*e.conjugate())
         self._work.d_psi_f = gain.k_f(fbk.w_m)*eps_f
         self._work.d_w_m = gain.alpha_o**2*eps_m
 
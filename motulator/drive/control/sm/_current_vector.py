@@ -1,16 +1,29 @@
 """Current-vector control methods for synchronous machine drives."""
 
 from dataclasses import dataclass, InitVar
+from functools import partial
 
 import numpy as np
 
 from motulator.drive.control import DriveControlSystem, SpeedController
 from motulator.common.control import ComplexPIController
 from motulator.drive.utils import SynchronousMachinePars
+from motulator.common.utils import cis
 from motulator.drive.control.sm._common import Observer, ObserverCfg
 from motulator.drive.control.sm._torque import TorqueCharacteristics
 
 
+# %%
+def _mtpa_i_sd_nonsalient(tau_M):
+    """MTPA d-axis current of a nonsalient machine."""
+    return 0.
+
+
+def _mtpa_i_sd_syrm(k, min_i_sd, max_i_sd, tau_M):
+    """Closed-form MTPA d-axis current of a SyRM."""
+    return np.clip(np.sqrt(tau_M/k), min_i_sd, max_i_sd)
+
+
 # %%
 class CurrentVectorControl(DriveControlSystem):
     """
@@ -75,8 +88,9 @@ class CurrentVectorControl(DriveControlSystem):
 
         if not self.observer:
             # No observer, use the measured values
-            fbk.i_s = np.exp(-1j*fbk.theta_m)*fbk.i_ss
-            fbk.u_s = np.exp(-1j*fbk.theta_m)*fbk.u_ss
+            rot = cis(-fbk.theta_m)
+            fbk.i_s = rot*fbk.i_ss
+            fbk.u_s = rot*fbk.u_ss
             fbk.w_s = fbk.w_m  # Angular speed of the coordinate system
 
         return fbk
@@ -87,7 +101,7 @@ class CurrentVectorControl(DriveControlSystem):
         ref = super().get_torque_reference(fbk, ref)
         ref = self.current_reference.output(fbk, ref)
         ref.u_s = self.current_ctrl.output(ref.i_s, fbk.i_s)
-        u_ss = ref.u_s*np.exp(1j*fbk.theta_m)
+        u_ss = ref.u_s*cis(fbk.theta_m)
         ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
 
         return ref
@@ -194,8 +208,23 @@ class CurrentReferenceCfg:
         tq = TorqueCharacteristics(par)
         mtpa = tq.mtpa_locus(self.max_i_s, self.min_psi_s)
         lim = tq.mtpv_and_current_limits(self.max_i_s)
-        # MTPA locus
-        self.mtpa_i_sd = mtpa.i_sd_vs_tau_M
+        # MTPA locus. The closed-form solution is used when the torque-to-
+        # current inversion is analytic, which is both faster and more
+        # accurate than interpolating the sampled locus. The salient PMSM
+        # falls back to the LUT.
+        if par.L_d == par.L_q:
+            # Nonsalient machine, i_sd = 0 on the MTPA locus
+            self.mtpa_i_sd = _mtpa_i_sd_nonsalient
+        elif par.psi_f == 0:
+            # SyRM, beta = pi/4 on the MTPA locus, i.e.,
+            # tau_M = 1.5*n_p*(L_d - L_q)*i_sd**2. The current is clamped
+            # between the minimum-flux and current-limit values, matching
+            # the end behavior of the sampled locus.
+            k = 1.5*par.n_p*(par.L_d - par.L_q)
+            min_i_sd, max_i_sd = self.min_psi_s/par.L_d, mtpa.i_s.real[-1]
+            self.mtpa_i_sd = partial(_mtpa_i_sd_syrm, k, min_i_sd, max_i_sd)
+        else:
+            self.mtpa_i_sd = mtpa.i_sd_vs_tau_M
         # Merged MTPV and current limits
         self.lim_tau_M = lim.tau_M_vs_abs_psi_s
         self.lim_i_sd = lim.i_sd_vs_tau_M
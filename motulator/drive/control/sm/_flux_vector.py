@@ -6,6 +6,7 @@ import numpy as np
 
 from motulator.drive.control import DriveControlSystem, SpeedController
 from motulator.drive.utils import SynchronousMachinePars
+from motulator.common.utils import cis
 from motulator.drive.control.sm._common import Observer, ObserverCfg
 from motulator.drive.control.sm._torque import TorqueCharacteristics
 
@@ -110,7 +111,7 @@ class FluxVectorControl(DriveControlSystem):
 
         # Stator voltage reference
         ref.u_s = par.R_s*fbk.i_s + 1j*fbk.w_m*fbk.psi_s + e_s
-        u_ss = ref.u_s*np.exp(1j*fbk.theta_m)
+        u_ss = ref.u_s*cis(fbk.theta_m)
         ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
 
         return ref
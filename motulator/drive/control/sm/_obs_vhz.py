@@ -9,7 +9,7 @@ from motulator.drive.control import DriveControlSystem
 from motulator.common.control import RateLimiter
 from motulator.drive.control.sm._flux_vector import (
     FluxTorqueReference, FluxTorqueReferenceCfg)
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
 
 
 # %%
@@ -91,8 +91,9 @@ class ObserverBasedVHzControl(DriveControlSystem):
 
         # Coordinate transformations
         fbk.theta_s = self.theta_s
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        rot = cis(-fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Limited flux references
         ref = self.flux_torque_reference(fbk, ref)
@@ -106,7 +107,7 @@ class ObserverBasedVHzControl(DriveControlSystem):
         # Voltage reference
         err = ref.psi_s - fbk.psi_s
         ref.u_s = par.R_s*fbk.i_s + 1j*fbk.w_s*ref.psi_s + cfg.alpha_psi*err
-        u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+        u_ss = ref.u_s*cis(fbk.theta_s)
         ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
         return ref
 
@@ -163,15 +164,16 @@ class FluxObserver:
 
         # Transformations to rotor coordinates. This is mathematically
         # equivalent to the version in [Tii2022].
-        i_sr = fbk.i_s*np.exp(1j*fbk.delta)
-        psi_sr = fbk.psi_s*np.exp(1j*fbk.delta)
+        rot = cis(fbk.delta)
+        i_sr = fbk.i_s*rot
+        psi_sr = fbk.psi_s*rot
 
         # Auxiliary flux and estimation error in rotor coordinates
         psi_ar = par.psi_f + (par.L_d - par.L_q)*np.conj(i_sr)
         e_r = par.L_d*i_sr.real + 1j*par.L_q*i_sr.imag + par.psi_f - psi_sr
 
         # Auxiliary flux in controller coordinates
-        psi_a = np.exp(-1j*fbk.delta)*psi_ar
+        psi_a = cis(-fbk.delta)*psi_ar
 
         k = self.b_p + 2*self.zeta_inf*np.abs(fbk.w_s)
 
@@ -6,7 +6,7 @@ import numpy as np
 from motulator.drive.control import DriveControlSystem, SpeedController
 from motulator.drive.control.sm._current_vector import (
     CurrentController, CurrentReference)
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
 
 
 # %%
@@ -63,8 +63,9 @@ class SignalInjectionControl(DriveControlSystem):
         fbk.theta_m = self.pll.state.theta_m
 
         # Current vector in (estimated) rotor coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_m)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_m)*fbk.u_ss
+        rot = cis(-fbk.theta_m)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Filter the current measurement for the current controller
         fbk.i_s_flt = self.signal_inj.filter_current(fbk.i_s)
@@ -82,7 +83,7 @@ class SignalInjectionControl(DriveControlSystem):
         ref.u_s = self.current_ctrl.output(
             ref.i_s, fbk.i_s_flt) + self.signal_inj.u_sd_inj
 
-        ref.u_ss = ref.u_s*np.exp(1j*fbk.theta_m)
+        ref.u_ss = ref.u_s*cis(fbk.theta_m)
         ref.d_abc = self.pwm(ref.T_s, ref.u_ss, fbk.u_dc, fbk.w_m)
 
         return ref
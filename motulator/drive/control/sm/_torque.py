@@ -18,13 +18,77 @@ from sys import float_info
 from types import SimpleNamespace
 
 import numpy as np
-from scipy.interpolate import interp1d
-import matplotlib.pyplot as plt
-from cycler import cycler
 
-plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
-plt.rcParams["lines.linewidth"] = 1.
-plt.rcParams.update({"text.usetex": False})  # Disable LaTeX in plots
+
+# %%
+def _setup_plots():
+    """
+    Import matplotlib lazily and set the plotting parameters.
+
+    This module is imported by the control systems for the look-up tables, so
+    matplotlib is imported only when one of the plotting methods is called.
+
+    """
+    import matplotlib.pyplot as plt
+    from cycler import cycler
+
+    plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
+    plt.rcParams["lines.linewidth"] = 1.
+    plt.rcParams.update({"text.usetex": False})  # Disable LaTeX in plots
+
+    return plt
+
+
+# %%
+class _LookupTable:
+    """
+    Piecewise-linear look-up table for scalar queries.
+
+    This is a lightweight replacement for `scipy.interpolate.interp1d` in the
+    control look-up tables, which are queried with scalars at every sampling
+    period. The breakpoints are sorted once at construction, and each query is
+    a single binary search followed by a linear blend of the two neighboring
+    points.
+
+    Parameters
+    ----------
+    x : ndarray
+        Breakpoints.
+    y : ndarray
+        Values at the breakpoints.
+    fill_value : float | tuple | "extrapolate", optional
+        Values outside the breakpoint range: a scalar applies to both sides, a
+        (below, above) pair to the corresponding sides, and "extrapolate"
+        continues the end segments. The default is NaN.
+
+    """
+
+    def __init__(self, x, y, fill_value=np.nan):
+        x, y = np.ravel(x), np.ravel(y)
+        order = np.argsort(x)
+        self._x = np.ascontiguousarray(x[order], dtype=float)
+        self._y = np.ascontiguousarray(y[order], dtype=float)
+        if not isinstance(fill_value, (tuple, str)):
+            fill_value = (fill_value, fill_value)
+        self._fill = fill_value
+
+    def __call__(self, x):
+        """Interpolate the value at the query point `x`."""
+        x_p, y_p = self._x, self._y
+        if x < x_p[0]:
+            if self._fill != "extrapolate":
+                return self._fill[0]
+            i = 0
+        elif x > x_p[-1]:
+            if self._fill != "extrapolate":
+                return self._fill[1]
+            i = x_p.size - 2
+        else:
+            i = min(np.searchsorted(x_p, x, side="right") - 1, x_p.size - 2)
+        d_x = x_p[i + 1] - x_p[i]
+        if d_x == 0:
+            return y_p[i]
+        return y_p[i] + (y_p[i + 1] - y_p[i])*(x - x_p[i])/d_x
 
 
 # %%
@@ -120,7 +184,7 @@ class TorqueCharacteristics:
         par = self.par
 
         # Replace zeros with epsilon
-        abs_i_s = (abs_i_s > 0)*abs_i_s + (abs_i_s <= 0)*float_info.epsilon
+        abs_i_s = np.maximum(abs_i_s, float_info.epsilon)
 
         if par.psi_f == 0:
             # SyRM (d-axis aligned with the maximum inductance)
@@ -156,8 +220,7 @@ class TorqueCharacteristics:
         """
         par = self.par
         # Replace zeros with epsilon
-        abs_psi_s = ((abs_psi_s > 0)*abs_psi_s +
-                     (abs_psi_s <= 0)*float_info.epsilon)
+        abs_psi_s = np.maximum(abs_psi_s, float_info.epsilon)
 
         if par.psi_f == 0:
             # SyRM (d-axis aligned with the maximum inductance)
@@ -269,8 +332,7 @@ class TorqueCharacteristics:
         if (min_psi_s is not None) and (par.psi_f == 0):
             # Minimum d-axis current for sensorless SyRM drives
             min_i_sd = min_psi_s/par.L_d
-            i_s.real = ((i_s.real < min_i_sd)*min_i_sd +
-                        (i_s.real >= min_i_sd)*i_s.real)
+            i_s.real = np.maximum(i_s.real, min_i_sd)
 
         psi_s = self.flux(i_s)
         abs_psi_s = np.abs(psi_s)
@@ -278,10 +340,10 @@ class TorqueCharacteristics:
 
         # Create an interpolant that can be used as a look-up table. If needed,
         # more interpolants can be easily added.
-        abs_psi_s_vs_tau_M = interp1d(
-            tau_M, abs_psi_s, fill_value=abs_psi_s[-1], bounds_error=False)
-        i_sd_vs_tau_M = interp1d(
-            tau_M, i_s.real, fill_value=i_s.real[-1], bounds_error=False)
+        abs_psi_s_vs_tau_M = _LookupTable(
+            tau_M, abs_psi_s, fill_value=abs_psi_s[-1])
+        i_sd_vs_tau_M = _LookupTable(
+            tau_M, i_s.real, fill_value=i_s.real[-1])
 
         return SimpleNamespace(
             psi_s=psi_s,
@@ -335,7 +397,7 @@ class TorqueCharacteristics:
 
         # Create an interpolant that can be used as a look-up table. If needed,
         # more interpolants can be easily added.
-        tau_M_vs_abs_psi_s = interp1d(np.abs(psi_s), tau_M, bounds_error=False)
+        tau_M_vs_abs_psi_s = _LookupTable(np.abs(psi_s), tau_M)
 
         return SimpleNamespace(
             psi_s=psi_s,
@@ -385,11 +447,8 @@ class TorqueCharacteristics:
 
         # Create an interpolant that can be used as a look-up table. If needed,
         # more interpolants can be easily added.
-        tau_M_vs_abs_psi_s = interp1d(
-            np.abs(psi_s),
-            tau_M,
-            bounds_error=False,
-            fill_value=(tau_M[0], tau_M[-1]))
+        tau_M_vs_abs_psi_s = _LookupTable(
+            np.abs(psi_s), tau_M, fill_value=(tau_M[0], tau_M[-1]))
 
         return SimpleNamespace(
             psi_s=psi_s,
@@ -438,12 +497,9 @@ class TorqueCharacteristics:
             i_sd = np.concatenate((mtpv.i_s.real, current_lim.i_s.real))
 
         # Create an interpolant that can be used as a look-up table
-        tau_M_vs_abs_psi_s = interp1d(
-            np.abs(psi_s),
-            tau_M,
-            bounds_error=False,
-            fill_value=(tau_M[0], tau_M[-1]))
-        i_sd_vs_tau_M = interp1d(tau_M, i_sd, fill_value="extrapolate")
+        tau_M_vs_abs_psi_s = _LookupTable(
+            np.abs(psi_s), tau_M, fill_value=(tau_M[0], tau_M[-1]))
+        i_sd_vs_tau_M = _LookupTable(tau_M, i_sd, fill_value="extrapolate")
 
         return SimpleNamespace(
             tau_M_vs_abs_psi_s=tau_M_vs_abs_psi_s, i_sd_vs_tau_M=i_sd_vs_tau_M)
@@ -462,6 +518,8 @@ class TorqueCharacteristics:
             Amount of points to be evaluated. The default is 20.
 
         """
+        plt = _setup_plots()
+
         # Compute the characteristics
         mtpa = self.mtpa_locus(max_i_s=max_i_s, N=N)
         mtpv = self.mtpv_locus(max_i_s=max_i_s, N=N)
@@ -506,6 +564,8 @@ class TorqueCharacteristics:
             Amount of points to be evaluated. The default is 20.
 
         """
+        plt = _setup_plots()
+
         # Compute the characteristics
         mtpa = self.mtpa_locus(max_i_s=max_i_s, N=N)
         mtpv = self.mtpv_locus(max_i_s=max_i_s, N=N)
@@ -552,6 +612,8 @@ class TorqueCharacteristics:
             Amount of points to be evaluated. The default is 20.
 
         """
+        plt = _setup_plots()
+
         # Compute the characteristics
         mtpa = self.mtpa_locus(max_i_s=max_i_s, N=N)
         mtpv = self.mtpv_locus(max_i_s=max_i_s, N=N)
@@ -605,6 +667,8 @@ class TorqueCharacteristics:
             Amount of points to be evaluated. The default is 20.
 
         """
+        plt = _setup_plots()
+
         # Compute the characteristics
         mtpa = self.mtpa_locus(max_i_s=max_i_s, N=N)
         mtpv = self.mtpv_locus(max_i_s=max_i_s, N=N)
@@ -2,7 +2,8 @@
 
 from motulator.common.model._converter import (
     FrequencyConverter, VoltageSourceConverter)
-from motulator.common.model._simulation import CarrierComparison, Simulation
+from motulator.common.model._simulation import (
+    CarrierComparison, Simulation, simulate_batch)
 from motulator.drive.model._drive import Drive, DriveWithLCFilter
 from motulator.drive.model._lc_filter import LCFilter
 from motulator.drive.model._machine import InductionMachine, SynchronousMachine
@@ -19,6 +20,7 @@ __all__ = [
     "VoltageSourceConverter",
     "LCFilter",
     "Simulation",
+    "simulate_batch",
     "SynchronousMachine",
     "StiffMechanicalSystem",
     "TwoMassMechanicalSystem",
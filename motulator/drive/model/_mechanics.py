@@ -7,6 +7,12 @@ import numpy as np
 from motulator.common.model import Subsystem
 
 
+# %%
+def _zero_profile(t):
+    """Zero profile, used as a picklable default for time functions."""
+    return 0*t
+
+
 # %%
 class StiffMechanicalSystem(Subsystem):
     """
@@ -27,7 +33,7 @@ class StiffMechanicalSystem(Subsystem):
 
     """
 
-    def __init__(self, J, B_L=0, tau_L=lambda t: 0*t):
+    def __init__(self, J, B_L=0, tau_L=_zero_profile):
         super().__init__()
         self.par = SimpleNamespace(J=J, B_L=B_L)
         self.tau_L = tau_L
@@ -109,7 +115,7 @@ class TwoMassMechanicalSystem(StiffMechanicalSystem):
 
     """
 
-    def __init__(self, par, tau_L=lambda t: 0*t):
+    def __init__(self, par, tau_L=_zero_profile):
         super().__init__(J=None, B_L=None, tau_L=tau_L)
         self.par = par
         self.state = SimpleNamespace(w_M=0, exp_j_theta_M=0, w_L=0, theta_ML=0)
@@ -179,7 +185,7 @@ class ExternalRotorSpeed(Subsystem):
 
     """
 
-    def __init__(self, w_M=lambda t: 0*t):
+    def __init__(self, w_M=_zero_profile):
         super().__init__()
         self.w_M = w_M
         self.state = SimpleNamespace(exp_j_theta_M=complex(1))
@@ -3,16 +3,22 @@
 from types import SimpleNamespace
 
 import numpy as np
-import matplotlib.pyplot as plt
-from cycler import cycler
 from scipy.io import loadmat
 from scipy.interpolate import griddata
 
-# Plotting parameters
-plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
-plt.rcParams["lines.linewidth"] = 1.
-plt.rcParams["axes.grid"] = True
-plt.rcParams.update({"text.usetex": False})
+
+# %%
+def _setup_plots():
+    """Import matplotlib lazily and set the plotting parameters."""
+    import matplotlib.pyplot as plt
+    from cycler import cycler
+
+    plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
+    plt.rcParams["lines.linewidth"] = 1.
+    plt.rcParams["axes.grid"] = True
+    plt.rcParams.update({"text.usetex": False})
+
+    return plt
 
 
 # %%
@@ -92,6 +98,8 @@ def plot_flux_map(data):
         Flux map data.
 
     """
+    plt = _setup_plots()
+
     fig = plt.figure(figsize=(10, 5))
     ax1 = fig.add_subplot(1, 2, 1, projection="3d")
     ax2 = fig.add_subplot(1, 2, 2, projection="3d")
@@ -118,6 +126,8 @@ def plot_torque_map(data):
         Flux map data.
 
     """
+    plt = _setup_plots()
+
     fig = plt.figure()
     ax = fig.add_subplot(projection="3d")
     ax.plot_surface(data.i_s.real, data.i_s.imag, data.tau_M)
@@ -137,6 +147,8 @@ def plot_flux_vs_current(data):
         Flux map data.
 
     """
+    plt = _setup_plots()
+
     # Indices corresponding to i_d = 0 and i_q = 0
     ind_d_0 = np.argmin(np.abs(data.i_s.real[0, :]))
     ind_q_0 = np.argmin(np.abs(data.i_s.imag[:, 0]))
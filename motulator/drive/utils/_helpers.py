@@ -9,7 +9,7 @@ import numpy as np
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class NominalValues:
     """
     Nominal values.
@@ -36,7 +36,7 @@ class NominalValues:
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class BaseValues:
     # pylint: disable=too-many-instance-attributes
     """
@@ -118,7 +118,7 @@ class BaseValues:
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class MachinePars(ABC):
     """
     Base class for electrical parameters of an electric machine.
@@ -136,7 +136,7 @@ class MachinePars(ABC):
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class SynchronousMachinePars(MachinePars):
     """
     Synchronous machine parameters.
@@ -161,7 +161,7 @@ class SynchronousMachinePars(MachinePars):
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class InductionMachinePars(MachinePars):
     """
     Γ-model parameters of an induction machine.
@@ -210,7 +210,7 @@ class InductionMachinePars(MachinePars):
 
 
 # %%
-@dataclass
+@dataclass(frozen=True)
 class InductionMachineInvGammaPars(MachinePars):
     """
     Inverse-Γ model parameters of an induction machine.
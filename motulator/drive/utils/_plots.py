@@ -3,16 +3,22 @@
 from types import SimpleNamespace
 
 import numpy as np
-import matplotlib.pyplot as plt
-from cycler import cycler
 
 from motulator.common.utils import complex2abc
 
-# Plotting parameters
-plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
-plt.rcParams["lines.linewidth"] = 1.
-plt.rcParams["axes.grid"] = True
-plt.rcParams.update({"text.usetex": False})
+
+# %%
+def _setup_plots():
+    """Import matplotlib lazily and set the plotting parameters."""
+    import matplotlib.pyplot as plt
+    from cycler import cycler
+
+    plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
+    plt.rcParams["lines.linewidth"] = 1.
+    plt.rcParams["axes.grid"] = True
+    plt.rcParams.update({"text.usetex": False})
+
+    return plt
 
 
 def _get_machine_type(mdl):
@@ -38,6 +44,8 @@ def plot(sim, base=None, t_span=None):
         Time span. The default is (0, sim.ctrl.t[-1]).
 
     """
+    plt = _setup_plots()
+
     # pylint: disable=too-many-statements
     mdl = sim.mdl  # Continuous-time data
     ctrl = sim.ctrl.data  # Discrete-time data
@@ -217,6 +225,8 @@ def plot_extra(sim, base=None, t_span=None):
         Time span. The default is (0, sim.ctrl.t[-1]).
 
     """
+    plt = _setup_plots()
+
     mdl = sim.mdl  # Continuous-time data
     ctrl = sim.ctrl.data  # Discrete-time data
     ctrl.t = ctrl.ref.t  # Discrete time
@@ -346,4 +356,6 @@ def save_plot(name):
         Name for the figure
 
     """
+    plt = _setup_plots()
+
     plt.savefig(name + ".pdf")
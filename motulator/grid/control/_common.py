@@ -6,7 +6,7 @@ from types import SimpleNamespace
 import numpy as np
 
 from motulator.common.control import ControlSystem, PIController, PWM
-from motulator.common.utils import abc2complex, wrap
+from motulator.common.utils import abc2complex, cis, wrap
 
 
 # %%
@@ -39,9 +39,10 @@ class PLL:
         fbk.theta_c = self.est.theta_c
         fbk.w_g = self.est.w_g
         # Coordinate transformations
-        fbk.u_g = np.exp(-1j*fbk.theta_c)*fbk.u_gs
-        fbk.i_c = np.exp(-1j*fbk.theta_c)*fbk.i_cs
-        fbk.u_c = np.exp(-1j*fbk.theta_c)*fbk.u_cs
+        rot = cis(-fbk.theta_c)
+        fbk.u_g = rot*fbk.u_gs
+        fbk.i_c = rot*fbk.i_cs
+        fbk.u_c = rot*fbk.u_cs
         # Error signal
         fbk.eps = fbk.u_g.imag/self.est.abs_u_g if self.est.abs_u_g > 0 else 0
         # Angular speed of the coordinate system
@@ -7,7 +7,7 @@ import numpy as np
 from motulator.common.control import ComplexPIController
 from motulator.grid.control._common import (
     CurrentLimiter, GridConverterControlSystem, PLL)
-from motulator.common.utils import abc2complex
+from motulator.common.utils import abc2complex, cis
 
 
 # %%
@@ -90,7 +90,7 @@ class GridFollowingControl(GridConverterControlSystem):
         # Voltage reference generation in synchronous coordinates
         ref.u_c = self.current_ctrl.output(
             ref.i_c, fbk.i_c, self.pll.est.abs_u_g)
-        ref.u_cs = np.exp(1j*fbk.theta_c)*ref.u_c
+        ref.u_cs = cis(fbk.theta_c)*ref.u_c
         # Duty ratios for PWM
         ref.d_abc = self.pwm(ref.T_s, ref.u_cs, fbk.u_dc, fbk.w_c)
         return ref
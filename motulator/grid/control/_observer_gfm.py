@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
 from motulator.grid.control._common import (
     GridConverterControlSystem, CurrentLimiter)
 
@@ -97,7 +97,7 @@ class ObserverBasedGridFormingControl(GridConverterControlSystem):
         fbk = super().get_feedback_signals(mdl)
         fbk.theta_c = self.observer.theta_c
         # Transform the measured values into synchronous coordinates
-        fbk.i_c = np.exp(-1j*fbk.theta_c)*fbk.i_cs
+        fbk.i_c = cis(-fbk.theta_c)*fbk.i_cs
         # Get estimates from the observer
         fbk = self.observer.output(fbk)
         return fbk
@@ -127,7 +127,7 @@ class ObserverBasedGridFormingControl(GridConverterControlSystem):
 
         # Voltage reference (with optional resistive voltage drop compensation)
         ref.u_c = fbk.e_c + fbk.v_c + cfg.R*fbk.i_c
-        ref.u_cs = np.exp(1j*fbk.theta_c)*ref.u_c
+        ref.u_cs = cis(fbk.theta_c)*ref.u_c
 
         # Duty ratios for PWM
         ref.d_abc = self.pwm(ref.T_s, ref.u_cs, fbk.u_dc, cfg.nom_w)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from motulator.common.utils import wrap
+from motulator.common.utils import cis, wrap
 from motulator.grid.control._common import (
     CurrentLimiter, GridConverterControlSystem)
 
@@ -81,8 +81,9 @@ class PowerSynchronizationControl(GridConverterControlSystem):
         fbk.theta_c = self.theta_c
         fbk.i_c_flt = self.i_c_flt
         # Transform the measured values into synchronous coordinates
-        fbk.i_c = np.exp(-1j*fbk.theta_c)*fbk.i_cs
-        fbk.u_c = np.exp(-1j*fbk.theta_c)*fbk.u_cs
+        rot = cis(-fbk.theta_c)
+        fbk.i_c = rot*fbk.i_cs
+        fbk.u_c = rot*fbk.u_cs
         # Active power
         p_loss = 1.5*self.cfg.R*np.abs(fbk.i_c)**2
         fbk.p_g = 1.5*np.real(fbk.u_c*np.conj(fbk.i_c)) - p_loss
@@ -110,7 +111,7 @@ class PowerSynchronizationControl(GridConverterControlSystem):
 
         # Calculation of converter voltage output reference
         ref.u_c = ref.v_c + cfg.R_a*(ref.i_c - fbk.i_c) + cfg.R*fbk.i_c
-        ref.u_cs = np.exp(1j*fbk.theta_c)*ref.u_c
+        ref.u_cs = cis(fbk.theta_c)*ref.u_c
 
         # Duty ratios for PWM
         ref.d_abc = self.pwm(ref.T_s, ref.u_cs, fbk.u_dc, fbk.w_c)
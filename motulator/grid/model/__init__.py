@@ -1,7 +1,8 @@
 """Continuous-time grid converter models."""
 
 from motulator.common.model._converter import VoltageSourceConverter
-from motulator.common.model._simulation import CarrierComparison, Simulation
+from motulator.common.model._simulation import (
+    CarrierComparison, Simulation, simulate_batch)
 from motulator.grid.model._ac_filter import ACFilter, LCLFilter, LFilter
 from motulator.grid.model._converter_system import GridConverterSystem
 from motulator.grid.model._voltage_source import ThreePhaseVoltageSource
@@ -14,5 +15,6 @@ __all__ = [
     "LFilter",
     "ThreePhaseVoltageSource",
     "Simulation",
+    "simulate_batch",
     "VoltageSourceConverter",
 ]
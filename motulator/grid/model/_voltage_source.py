@@ -63,7 +63,9 @@ class ThreePhaseVoltageSource(Subsystem):
         abs_e_g_neg = self._get_value(t, self.par.abs_e_g_neg)
         phi_neg = self._get_value(t, self.par.phi_neg)
 
-        # Space vector in stationary coordinates
+        # Space vector in stationary coordinates. The phase angles can be
+        # time functions and this method is also called with the whole time
+        # array in post-processing, so np.exp is used instead of cis().
         e_gs = abs_e_g*exp_j_theta_g*np.exp(1j*phi)
         # Add possible negative sequence component
         e_gs += abs_e_g_neg*np.conj(exp_j_theta_g*np.exp(1j*phi_neg))
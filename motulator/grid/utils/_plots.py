@@ -3,16 +3,22 @@
 from types import SimpleNamespace
 
 import numpy as np
-import matplotlib.pyplot as plt
-from cycler import cycler
 
 from motulator.common.utils import complex2abc
 
-# Plotting parameters
-plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
-plt.rcParams["lines.linewidth"] = 1.
-plt.rcParams["axes.grid"] = True
-plt.rcParams.update({"text.usetex": False})
+
+# %%
+def _setup_plots():
+    """Import matplotlib lazily and set the plotting parameters."""
+    import matplotlib.pyplot as plt
+    from cycler import cycler
+
+    plt.rcParams["axes.prop_cycle"] = cycler(color="brgcmyk")
+    plt.rcParams["lines.linewidth"] = 1.
+    plt.rcParams["axes.grid"] = True
+    plt.rcParams.update({"text.usetex": False})
+
+    return plt
 
 
 # %%
@@ -38,6 +44,7 @@ def plot(sim, base=None, plot_pcc_voltage=True, plot_w=False, t_span=None):
         Time span. The default is (0, sim.ctrl.ref.t[-1]).
 
     """
+    plt = _setup_plots()
 
     mdl = sim.mdl  # Continuous-time data
     ctrl = sim.ctrl.data  # Discrete-time data
@@ -288,6 +295,7 @@ def plot_voltage_vector(sim, base=None):
         Base values for scaling the waveforms.
 
     """
+    plt = _setup_plots()
 
     mdl = sim.mdl  # Continuous-time data
 
@@ -334,4 +342,6 @@ def save_plot(name):
         Name for the figure
 
     """
+    plt = _setup_plots()
+
     plt.savefig(name + ".pdf")